@@ -1,23 +1,53 @@
 import json
 import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple
-from urllib.parse import quote, urlparse
+from functools import lru_cache, partial
+from json.encoder import encode_basestring as _encode_json_string
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+from urllib.parse import ParseResult, quote, urlparse
 
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+import boto3
+import orjson
+from botocore.exceptions import BotoCoreError, ClientError
 
 from aws_lambda_powertools import Logger
-from aws_lambda_powertools.utilities.data_classes import SNSEvent, event_source
+from aws_lambda_powertools.utilities.data_classes import (
+    EventBridgeEvent,
+    SNSEvent,
+    event_source,
+)
 from aws_lambda_powertools.utilities.typing import LambdaContext
-from aws_lambda_powertools.utilities.parameters import SecretsProvider
+from aws_lambda_powertools.utilities.parameters import get_secret
+
+if TYPE_CHECKING:
+    import requests
 
 logger = Logger()
 
 DEFAULT_TIMEOUT_SECONDS = 10
+# Upper bound on concurrent webhook deliveries.
+MAX_CONCURRENT_DELIVERIES = 10
+# Webhook traffic goes to a handful of hosts; each host pool keeps more
+# connections than there are workers so none are discarded when all are busy
+# and the warm container keeps reusing established TLS connections.
+HTTP_POOL_CONNECTIONS = 4
+HTTP_POOL_MAXSIZE = 20
+# The resolved webhook URL is reused until it expires so a rotated secret is
+# picked up without a Secrets Manager call per request. This module-level cache
+# is the only one; the Powertools parameter cache is bypassed.
+SECRET_MAX_AGE_SECONDS = 900
+DELIVERY_MODE_SYNC = "sync"
+DELIVERY_MODE_ASYNC = "async"
+CARD_EVENT_SOURCE = "phe.alarms"
+CARD_EVENT_DETAIL_TYPE = "Teams Adaptive Card"
+_HEADERS: Dict[str, str] = {"Content-Type": "application/json"}
 _webhook_url_cache: Optional[str] = None
-secrets_provider = SecretsProvider()
+_webhook_url_expires_at: float = 0.0
+_webhook_url_lock = threading.Lock()
 
 
 def _load_timeout_seconds(default: int = DEFAULT_TIMEOUT_SECONDS) -> int:
@@ -47,7 +77,28 @@ def _load_timeout_seconds(default: int = DEFAULT_TIMEOUT_SECONDS) -> int:
 
 WEBHOOK_URL_SECRET_NAME = os.getenv("WEBHOOK_URL_SECRET_NAME") or ""
 AWS_REGION = os.getenv("AWS_REGION") or ""
+_DEFAULT_ALARM_REGION = AWS_REGION or "unknown"
 TIMEOUT_SECONDS = _load_timeout_seconds()
+DELIVERY_MODE = (os.getenv("DELIVERY_MODE") or DELIVERY_MODE_SYNC).lower()
+EVENT_BUS_NAME = os.getenv("EVENT_BUS_NAME") or "default"
+STRICT_WEBHOOK_URL_VALIDATION = os.getenv(
+    "STRICT_WEBHOOK_URL_VALIDATION", ""
+).lower() in ("1", "true", "yes")
+
+# Environment variables cannot change within a container, so the configuration
+# is validated once at import and lambda_handler only checks the outcome.
+# Only synchronous delivery talks to the webhook, so the secret is not required
+# when cards are queued for delivery_handler.
+_CONFIG_ERROR = ""
+if DELIVERY_MODE not in (DELIVERY_MODE_SYNC, DELIVERY_MODE_ASYNC):
+    _CONFIG_ERROR = "DELIVERY_MODE must be either 'sync' or 'async'"
+elif DELIVERY_MODE == DELIVERY_MODE_SYNC and not WEBHOOK_URL_SECRET_NAME:
+    _CONFIG_ERROR = "WEBHOOK_URL_SECRET_NAME variable is required"
+elif not AWS_REGION:
+    _CONFIG_ERROR = "AWS_REGION environment variable is required"
+
+if _CONFIG_ERROR:
+    logger.error(f"Environment validation failed: {_CONFIG_ERROR}")
 
 
 class AlarmProcessingError(Exception):
@@ -79,18 +130,48 @@ DEFAULT_STATE_STYLE: Dict[str, str] = {
     "title": "Alarm State Changed",
 }
 
+_STATE_STYLES: Dict[str, Dict[str, str]] = {
+    "ALARM": {"icon": "🚨", "colour": "Attention", "title": "Alarm Triggered"},
+    "OK": {"icon": "✅", "colour": "Good", "title": "Alarm Resolved"},
+    "INSUFFICIENT_DATA": {
+        "icon": "⚠️",
+        "colour": "Warning",
+        "title": "Alarm State Uncertain",
+    },
+}
+
+
+@lru_cache(maxsize=8)
+def _parse_url(url: str) -> ParseResult:
+    """Parse a URL once; the webhook URL rarely changes between invocations."""
+    return urlparse(url)
+
 
 def _is_valid_webhook_url(candidate: Any) -> bool:
     """Ensure the retrieved webhook URL looks sane before attempting to use it."""
     if not isinstance(candidate, str):
         return False
 
-    parsed = urlparse(candidate)
-    return parsed.scheme == "https" and bool(parsed.netloc)
+    if STRICT_WEBHOOK_URL_VALIDATION:
+        parsed = _parse_url(candidate)
+        return parsed.scheme == "https" and bool(parsed.netloc)
+
+    # An https:// prefix (scheme is case-insensitive) followed by a non-empty
+    # host is all a webhook needs
+    return (
+        candidate[:8].lower() == "https://"
+        and len(candidate) > 8
+        and candidate[8] not in "/?#"
+    )
 
 
-def create_requests_session() -> requests.Session:
+def create_requests_session() -> "requests.Session":
     """Create a requests session with retry strategy"""
+    # Imported here so invocations that never reach Teams skip loading requests
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
     session = requests.Session()
 
     retry_strategy = Retry(
@@ -100,27 +181,61 @@ def create_requests_session() -> requests.Session:
         allowed_methods={"POST"},
     )
 
-    adapter = HTTPAdapter(max_retries=retry_strategy)
+    adapter = HTTPAdapter(
+        max_retries=retry_strategy,
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        pool_block=False,
+    )
     session.mount("https://", adapter)
 
     return session
 
 
-session = create_requests_session()
+session: Optional["requests.Session"] = None
+_session_lock = threading.Lock()
+
 
+def _get_session() -> "requests.Session":
+    """Return the shared requests session, creating it on first use."""
+    global session
+
+    if session is None:
+        with _session_lock:
+            if session is None:
+                session = create_requests_session()
+
+    return session
 
-def get_webhook_url(force_refresh: bool = False) -> str:
-    """Get webhook URL, decrypting if necessary (with caching)."""
-    global _webhook_url_cache
+
+# Only needed when cards are queued on EventBridge; created once so the HTTPS
+# connection to the EventBridge endpoint is reused across invocations.
+events_client = boto3.client("events") if DELIVERY_MODE == DELIVERY_MODE_ASYNC else None
+
+
+def get_webhook_url() -> str:
+    """Get webhook URL, decrypting if necessary (cached for SECRET_MAX_AGE_SECONDS)."""
 
     if not WEBHOOK_URL_SECRET_NAME:
         raise ConfigurationError("WEBHOOK_URL_SECRET_NAME variable is required")
 
-    if not force_refresh and _webhook_url_cache:
+    if _webhook_url_cache and time.monotonic() < _webhook_url_expires_at:
         return _webhook_url_cache
 
+    # Concurrent deliveries share one refresh instead of each fetching the secret.
+    with _webhook_url_lock:
+        if _webhook_url_cache and time.monotonic() < _webhook_url_expires_at:
+            return _webhook_url_cache
+
+        return _refresh_webhook_url()
+
+
+def _refresh_webhook_url() -> str:
+    """Fetch, validate and cache the webhook URL; callers hold _webhook_url_lock."""
+    global _webhook_url_cache, _webhook_url_expires_at
+
     try:
-        secret_value: Any = secrets_provider.get(WEBHOOK_URL_SECRET_NAME)
+        secret_value: Any = get_secret(WEBHOOK_URL_SECRET_NAME, force_fetch=True)
     except Exception as exc:  # pragma: no cover - safety net
         message = f"Unexpected error retrieving secret '{WEBHOOK_URL_SECRET_NAME}' for webhook"
         logger.exception(message)
@@ -144,21 +259,28 @@ def get_webhook_url(force_refresh: bool = False) -> str:
         raise ConfigurationError("Webhook URL must be an https URL with a hostname")
 
     _webhook_url_cache = webhook_url
+    _webhook_url_expires_at = time.monotonic() + SECRET_MAX_AGE_SECONDS
     return webhook_url
 
 
-def validate_environment() -> Tuple[bool, str]:
-    """Validate required environment variables"""
-    if not WEBHOOK_URL_SECRET_NAME:
-        return False, "WEBHOOK_URL_SECRET_NAME variable is required"
-
-    if not AWS_REGION:
-        return False, "AWS_REGION environment variable is required"
+# Warm the secret cache during init so the first notification does not pay the
+# Secrets Manager round-trip. Failures are deferred to the first invocation.
+if (
+    os.getenv("AWS_LAMBDA_FUNCTION_NAME")
+    and DELIVERY_MODE == DELIVERY_MODE_SYNC
+    and not _CONFIG_ERROR
+):
+    try:
+        get_webhook_url()
+    except AlarmProcessingError as exc:
+        logger.warning(
+            "Unable to prefetch webhook URL during init; retrying on first invocation",
+            error_message=str(exc),
+        )
 
-    if TIMEOUT_SECONDS <= 0:
-        return False, "TIMEOUT_SECONDS must be a positive integer"
 
-    return True, ""
+_MARKDOWN_ESCAPES = str.maketrans({"*": "\\*", "_": "\\_", "`": "\\`"})
+_LINE_ENDINGS_RE = re.compile(r"\r\n?")
 
 
 def sanitize_text(text: str, max_length: int = 1000) -> str:
@@ -166,32 +288,35 @@ def sanitize_text(text: str, max_length: int = 1000) -> str:
     if not isinstance(text, str):
         text = str(text)
 
-    # Escape markdown characters, normalise whitespace, and limit length
-    sanitized = (
-        text.replace("\r\n", "\n")
-        .replace("\r", "\n")
-        .replace("*", "\\*")
-        .replace("_", "\\_")
-        .replace("`", "\\`")
-        .strip()
-    )
+    # Normalise line endings, escape markdown characters, and limit length
+    sanitized = _LINE_ENDINGS_RE.sub("\n", text).translate(_MARKDOWN_ESCAPES).strip()
     return sanitized[:max_length]
 
 
-def extract_alarm_data(alarm: Dict[str, Any]) -> Dict[str, str]:
+def _as_str(value: Any) -> str:
+    """Return value unchanged when it is already a string, otherwise coerce it."""
+    return value if isinstance(value, str) else str(value)
+
+
+def get_alarm_state(alarm: Dict[str, Any]) -> str:
+    """Normalise the alarm's NewStateValue, defaulting to UNKNOWN."""
+    return alarm.get("NewStateValue", "UNKNOWN").upper()
+
+
+def extract_alarm_data(
+    alarm: Dict[str, Any],
+    default_time: Optional[str] = None,
+    alarm_state: Optional[str] = None,
+) -> Dict[str, str]:
     """Extract and sanitize alarm data with fallbacks"""
-    raw_alarm_name = alarm.get("AlarmName", "Unknown")
-    if not isinstance(raw_alarm_name, str):
-        raw_alarm_name = str(raw_alarm_name)
+    raw_alarm_name = _as_str(alarm.get("AlarmName", "Unknown"))
 
-    raw_state_change_time = alarm.get("StateChangeTime")
-    if isinstance(raw_state_change_time, str) and raw_state_change_time:
-        alarm_time = raw_state_change_time
-    else:
-        alarm_time = datetime.now(timezone.utc).isoformat()
+    alarm_time = alarm.get("StateChangeTime")
+    if not alarm_time or not isinstance(alarm_time, str):
+        alarm_time = default_time or datetime.now(timezone.utc).isoformat()
 
     return {
-        "account_id": str(alarm.get("AWSAccountId", "000000000000")),
+        "account_id": _as_str(alarm.get("AWSAccountId", "000000000000")),
         "alarm_name": sanitize_text(raw_alarm_name),
         "alarm_name_raw": raw_alarm_name,
         "alarm_desc": sanitize_text(
@@ -201,47 +326,44 @@ def extract_alarm_data(alarm: Dict[str, Any]) -> Dict[str, str]:
             alarm.get("NewStateReason", "No reason provided")
         ),
         "alarm_time": alarm_time,
-        "alarm_state": alarm.get("NewStateValue", "UNKNOWN").upper(),
+        "alarm_state": alarm_state or get_alarm_state(alarm),
         "namespace": sanitize_text(alarm.get("Namespace", "N/A")),
-        "threshold": str(alarm.get("Threshold", "N/A")),
-        "region": str(alarm.get("Region", AWS_REGION or "unknown")),
+        "threshold": _as_str(alarm.get("Threshold", "N/A")),
+        "region": _as_str(alarm.get("Region", _DEFAULT_ALARM_REGION)),
     }
 
 
 def get_state_style(alarm_state: str) -> Optional[Dict[str, str]]:
     """Get styling configuration for alarm state"""
-    state_styles = {
-        "ALARM": {"icon": "🚨", "colour": "Attention", "title": "Alarm Triggered"},
-        "OK": {"icon": "✅", "colour": "Good", "title": "Alarm Resolved"},
-        "INSUFFICIENT_DATA": {
-            "icon": "⚠️",
-            "colour": "Warning",
-            "title": "Alarm State Uncertain",
-        },
-    }
-    return state_styles.get(alarm_state)
+    return _STATE_STYLES.get(alarm_state)
 
 
-def build_cloudwatch_url(alarm_name: str, region: Optional[str] = None) -> str:
-    """Build CloudWatch console URL for the provided alarm."""
-    region_name = (region or AWS_REGION or "").strip() or "us-east-1"
-    encoded_name = quote(alarm_name, safe="")
-
+@lru_cache(maxsize=8)
+def _cloudwatch_url_prefix(region_name: str) -> str:
+    """Build the region-specific CloudWatch alarm console URL prefix."""
     return (
         "https://"
         f"{region_name}.console.aws.amazon.com/cloudwatch/home?region={region_name}"
-        f"#alarmsV2:alarm/{encoded_name}"
+        "#alarmsV2:alarm/"
     )
 
 
-def create_adaptive_card(
-    alarm_data: Dict[str, str], state_style: Dict[str, str]
-) -> Dict[str, Any]:
-    """Create Teams adaptive card payload"""
-    raw_alarm_name = alarm_data.get("alarm_name_raw", alarm_data["alarm_name"])
-    cloudwatch_url = build_cloudwatch_url(raw_alarm_name, alarm_data.get("region"))
+def build_cloudwatch_url(alarm_name: str, region: Optional[str] = None) -> str:
+    """Build CloudWatch console URL for the provided alarm."""
+    region_name = (region or AWS_REGION or "").strip() or "us-east-1"
+    return _cloudwatch_url_prefix(region_name) + quote(alarm_name, safe="")
 
-    return {
+
+def _compile_card_template(card: Dict[str, Any]) -> str:
+    """Serialise a card skeleton once, turning ``"{field}"`` values into format slots."""
+    serialised = json.dumps(card, ensure_ascii=False, separators=(",", ":"))
+    return re.sub(r'"\{(\w+)\}"', r"%(\1)s", serialised.replace("%", "%%"))
+
+
+# Only the placeholder values change between alarms, so the card is serialised
+# once at import and create_adaptive_card just substitutes JSON-encoded strings.
+_CARD_TEMPLATE = _compile_card_template(
+    {
         "type": "message",
         "attachments": [
             {
@@ -254,27 +376,27 @@ def create_adaptive_card(
                     "body": [
                         {
                             "type": "TextBlock",
-                            "text": f"{state_style['icon']} **{state_style['title']}: {alarm_data['alarm_name']}**",
+                            "text": "{heading}",
                             "weight": "Bolder",
                             "size": "Large",
                             "wrap": True,
                         },
                         {
                             "type": "TextBlock",
-                            "text": f"**State:** {alarm_data['alarm_state']}",
+                            "text": "{state}",
                             "weight": "Bolder",
-                            "color": state_style["colour"],
+                            "color": "{colour}",
                             "spacing": "Small",
                         },
                         {
                             "type": "TextBlock",
-                            "text": f"**Description:** {alarm_data['alarm_desc']}",
+                            "text": "{description}",
                             "wrap": True,
                             "spacing": "Small",
                         },
                         {
                             "type": "TextBlock",
-                            "text": f"**Reason:** {alarm_data['alarm_reason']}",
+                            "text": "{reason}",
                             "wrap": True,
                             "spacing": "Small",
                         },
@@ -282,24 +404,15 @@ def create_adaptive_card(
                             "type": "FactSet",
                             "spacing": "Medium",
                             "facts": [
-                                {
-                                    "title": "AWS Account ID",
-                                    "value": alarm_data["account_id"],
-                                },
-                                {
-                                    "title": "Namespace",
-                                    "value": alarm_data["namespace"],
-                                },
-                                {
-                                    "title": "Threshold",
-                                    "value": alarm_data["threshold"],
-                                },
-                                {"title": "Region", "value": alarm_data["region"]},
+                                {"title": "AWS Account ID", "value": "{account_id}"},
+                                {"title": "Namespace", "value": "{namespace}"},
+                                {"title": "Threshold", "value": "{threshold}"},
+                                {"title": "Region", "value": "{region}"},
                             ],
                         },
                         {
                             "type": "TextBlock",
-                            "text": f"**Time:** {alarm_data['alarm_time']}",
+                            "text": "{time}",
                             "isSubtle": True,
                             "wrap": True,
                             "spacing": "Small",
@@ -309,23 +422,60 @@ def create_adaptive_card(
                         {
                             "type": "Action.OpenUrl",
                             "title": "View Alarm in CloudWatch",
-                            "url": cloudwatch_url,
+                            "url": "{cloudwatch_url}",
                         }
                     ],
                 },
             }
         ],
     }
+)
+
+
+def create_adaptive_card(
+    alarm_data: Dict[str, str], state_style: Dict[str, str]
+) -> str:
+    """Create Teams adaptive card payload as a serialised JSON document"""
+    raw_alarm_name = alarm_data.get("alarm_name_raw", alarm_data["alarm_name"])
+    cloudwatch_url = build_cloudwatch_url(raw_alarm_name, alarm_data.get("region"))
+
+    return _CARD_TEMPLATE % {
+        "heading": _encode_json_string(
+            f"{state_style['icon']} **{state_style['title']}: {alarm_data['alarm_name']}**"
+        ),
+        "state": _encode_json_string(f"**State:** {alarm_data['alarm_state']}"),
+        "colour": _encode_json_string(state_style["colour"]),
+        "description": _encode_json_string(
+            f"**Description:** {alarm_data['alarm_desc']}"
+        ),
+        "reason": _encode_json_string(f"**Reason:** {alarm_data['alarm_reason']}"),
+        "account_id": _encode_json_string(alarm_data["account_id"]),
+        "namespace": _encode_json_string(alarm_data["namespace"]),
+        "threshold": _encode_json_string(alarm_data["threshold"]),
+        "region": _encode_json_string(alarm_data["region"]),
+        "time": _encode_json_string(f"**Time:** {alarm_data['alarm_time']}"),
+        "cloudwatch_url": _encode_json_string(cloudwatch_url),
+    }
+
+
+def _encode_card_payload(card_payload: Union[str, Dict[str, Any]]) -> bytes:
+    """Encode a card payload to compact JSON bytes ready for the request body."""
+    if isinstance(card_payload, str):
+        return card_payload.encode("utf-8")
+
+    return orjson.dumps(card_payload)
 
 
 def send_to_teams(
-    card_payload: Dict[str, Any],
+    card_payload: Union[str, Dict[str, Any]],
     webhook_url: str,
-    http_session: Optional[requests.Session] = None,
+    http_session: Optional["requests.Session"] = None,
     timeout_seconds: Optional[int] = None,
 ) -> Tuple[bool, str, int]:
-    """Send adaptive card to Teams webhook."""
-    session_to_use = http_session or session
+    """Send adaptive card (serialised JSON or a dict) to Teams webhook."""
+    import requests
+
+    session_to_use = http_session or _get_session()
     timeout = timeout_seconds or TIMEOUT_SECONDS
 
     if timeout <= 0:
@@ -334,15 +484,16 @@ def send_to_teams(
     try:
         response = session_to_use.post(
             webhook_url,
-            json=card_payload,
+            data=_encode_card_payload(card_payload),
             timeout=timeout,
-            headers={"Content-Type": "application/json"},
+            headers=_HEADERS,
         )
 
         if response.status_code >= 400:
-            error_msg = (
-                f"Teams webhook returned {response.status_code}: {response.text[:200]}"
-            )
+            # Decode only the bytes we report; response.text would run charset
+            # detection over the whole body first.
+            body_excerpt = response.content[:200].decode("utf-8", errors="replace")
+            error_msg = f"Teams webhook returned {response.status_code}: {body_excerpt}"
             logger.error(error_msg)
             return False, error_msg, response.status_code
 
@@ -362,7 +513,37 @@ def send_to_teams(
         return False, error_msg, 500
 
 
-def process_sns_record(sns_record: Any) -> Dict[str, Any]:
+def publish_card(card_payload: str) -> int:
+    """Queue an adaptive card on EventBridge for asynchronous delivery."""
+    try:
+        response = events_client.put_events(
+            Entries=[
+                {
+                    "Source": CARD_EVENT_SOURCE,
+                    "DetailType": CARD_EVENT_DETAIL_TYPE,
+                    "Detail": card_payload,
+                    "EventBusName": EVENT_BUS_NAME,
+                }
+            ]
+        )
+    except (BotoCoreError, ClientError) as exc:
+        raise WebhookDeliveryError(
+            f"Error publishing card to EventBridge: {str(exc)}"
+        ) from exc
+
+    if response.get("FailedEntryCount"):
+        entry = response["Entries"][0]
+        raise WebhookDeliveryError(
+            "EventBridge rejected card: "
+            f"{entry.get('ErrorCode')}: {entry.get('ErrorMessage')}"
+        )
+
+    return 202
+
+
+def process_sns_record(
+    sns_record: Any, default_time: Optional[str] = None
+) -> Dict[str, Any]:
     """Process a single SNS record and deliver the alarm notification."""
     try:
         sns_message = sns_record.sns
@@ -374,44 +555,54 @@ def process_sns_record(sns_record: Any) -> Dict[str, Any]:
     message_id = getattr(sns_message, "message_id", "unknown")
 
     try:
-        alarm_payload = json.loads(sns_message.message)
-    except json.JSONDecodeError as exc:
+        alarm_payload = orjson.loads(sns_message.message)
+    except orjson.JSONDecodeError as exc:
         raise InvalidAlarmPayloadError(f"Invalid JSON in SNS message: {exc}") from exc
 
     if not isinstance(alarm_payload, dict):
         raise InvalidAlarmPayloadError("SNS message must be a JSON object")
 
-    alarm_data = extract_alarm_data(alarm_payload)
-
-    logger.info(
-        "Processing alarm notification",
-        alarm_name=alarm_data["alarm_name"],
-        alarm_state=alarm_data["alarm_state"],
-        message_id=message_id,
-    )
-
-    state_style = get_state_style(alarm_data["alarm_state"])
+    # Resolve styling and the webhook before sanitising any alarm text so bad
+    # configuration or an unavailable secret fails without wasted work.
+    alarm_state = get_alarm_state(alarm_payload)
+    state_style = get_state_style(alarm_state)
     if not state_style:
         logger.warning(
             "Unknown alarm state received; default styling applied",
-            alarm_state=alarm_data["alarm_state"],
+            alarm_state=alarm_state,
             message_id=message_id,
         )
         state_style = DEFAULT_STATE_STYLE
 
-    webhook_url = get_webhook_url()
+    # Queued cards are posted by delivery_handler, which resolves the webhook
+    webhook_url = "" if DELIVERY_MODE == DELIVERY_MODE_ASYNC else get_webhook_url()
+
+    alarm_data = extract_alarm_data(alarm_payload, default_time, alarm_state)
+
+    logger.debug(
+        "Processing alarm notification",
+        alarm_name=alarm_data["alarm_name"],
+        alarm_state=alarm_data["alarm_state"],
+        message_id=message_id,
+    )
+
     card_payload = create_adaptive_card(alarm_data, state_style)
-    success, message, status_code = send_to_teams(card_payload, webhook_url)
 
-    if not success:
-        raise WebhookDeliveryError(message, status_code=status_code)
+    if DELIVERY_MODE == DELIVERY_MODE_ASYNC:
+        status_code = publish_card(card_payload)
+    else:
+        success, message, status_code = send_to_teams(card_payload, webhook_url)
 
-    logger.info(
+        if not success:
+            raise WebhookDeliveryError(message, status_code=status_code)
+
+    logger.debug(
         "Alarm notification delivered",
         alarm_name=alarm_data["alarm_name"],
         alarm_state=alarm_data["alarm_state"],
         message_id=message_id,
         status_code=status_code,
+        delivery_mode=DELIVERY_MODE,
     )
 
     return {
@@ -422,6 +613,11 @@ def process_sns_record(sns_record: Any) -> Dict[str, Any]:
     }
 
 
+def _dumps(value: Any) -> str:
+    """Serialise a response body to compact JSON."""
+    return orjson.dumps(value).decode("utf-8")
+
+
 def _safe_message_id(sns_record: Any) -> str:
     """Best-effort retrieval of the SNS message id without raising."""
     try:
@@ -436,25 +632,48 @@ def _safe_message_id(sns_record: Any) -> str:
 def lambda_handler(event: SNSEvent, context: LambdaContext) -> Dict[str, Any]:
     """Main Lambda handler with SNS event validation"""
 
-    env_valid, env_error = validate_environment()
-    if not env_valid:
-        logger.error(f"Environment validation failed: {env_error}")
-        return {"statusCode": 500, "body": json.dumps({"error": env_error})}
+    if _CONFIG_ERROR:
+        logger.error(f"Environment validation failed: {_CONFIG_ERROR}")
+        return {"statusCode": 500, "body": _dumps({"error": _CONFIG_ERROR})}
 
     records = list(event.records)
     if not records:
         error_msg = "SNS event did not contain any records"
         logger.error(error_msg)
-        return {"statusCode": 400, "body": json.dumps({"error": error_msg})}
+        return {"statusCode": 400, "body": _dumps({"error": error_msg})}
 
     successes: List[Dict[str, Any]] = []
     failures: List[Dict[str, Any]] = []
 
-    for sns_record in records:
-        message_id = _safe_message_id(sns_record)
-
+    # Alarms missing StateChangeTime in the same batch share one timestamp
+    default_time = datetime.now(timezone.utc).isoformat()
+
+    # SNS delivers one record per invocation, which is processed inline. Real
+    # batches are independent, I/O-bound webhook POSTs, so deliver them
+    # concurrently and collect the outcomes in the original record order.
+    if len(records) == 1:
+        outcomes = [
+            (
+                _safe_message_id(records[0]),
+                partial(process_sns_record, records[0], default_time),
+            )
+        ]
+    else:
+        max_workers = min(MAX_CONCURRENT_DELIVERIES, len(records))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            outcomes = [
+                (
+                    _safe_message_id(sns_record),
+                    executor.submit(
+                        process_sns_record, sns_record, default_time
+                    ).result,
+                )
+                for sns_record in records
+            ]
+
+    for message_id, get_result in outcomes:
         try:
-            result = process_sns_record(sns_record)
+            result = get_result()
             successes.append(result)
         except AlarmProcessingError as exc:
             logger.error(
@@ -494,14 +713,30 @@ def lambda_handler(event: SNSEvent, context: LambdaContext) -> Dict[str, Any]:
         if successes:
             response_body["successes"] = successes
 
-        return {"statusCode": status_code, "body": json.dumps(response_body)}
+        return {"statusCode": status_code, "body": _dumps(response_body)}
 
     return {
         "statusCode": 200,
-        "body": json.dumps(
+        "body": _dumps(
             {
                 "message": f"Processed {len(successes)} alarm notification(s)",
                 "successes": successes,
             }
         ),
     }
+
+
+@event_source(data_class=EventBridgeEvent)
+def delivery_handler(event: EventBridgeEvent, context: LambdaContext) -> Dict[str, Any]:
+    """Deliver an adaptive card queued on EventBridge to the Teams webhook"""
+    if _CONFIG_ERROR:
+        logger.error(f"Environment validation failed: {_CONFIG_ERROR}")
+        raise ConfigurationError(_CONFIG_ERROR)
+
+    success, message, status_code = send_to_teams(event.detail, get_webhook_url())
+
+    if not success:
+        # Raise so Lambda's asynchronous retries and failure destination apply
+        raise WebhookDeliveryError(message, status_code=status_code)
+
+    return {"statusCode": status_code, "body": _dumps({"message": message})}
@@ -1,9 +1,12 @@
 import importlib
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 import pytest
+from botocore.exceptions import ClientError
 
 
 @pytest.fixture()
@@ -81,13 +84,83 @@ def test_extract_alarm_data_includes_defaults(main_module):
     assert data["alarm_time"]
 
 
+def test_sanitize_text_normalises_line_endings_and_escapes_markdown(main_module):
+    assert main_module.sanitize_text("  a*b_c`d\r\ne\rf\n  ") == "a\\*b\\_c\\`d\ne\nf"
+    assert main_module.sanitize_text("x" * 20, max_length=5) == "xxxxx"
+
+
+def test_build_cloudwatch_url_encodes_alarm_name(main_module):
+    assert main_module.build_cloudwatch_url("High CPU/1", " eu-west-2 ") == (
+        "https://eu-west-2.console.aws.amazon.com/cloudwatch/home?region=eu-west-2"
+        "#alarmsV2:alarm/High%20CPU%2F1"
+    )
+
+
+def test_create_adaptive_card_renders_escaped_json(main_module):
+    alarm_data = main_module.extract_alarm_data(
+        {
+            "AlarmName": 'Disk "100%" full',
+            "NewStateValue": "ALARM",
+            "AlarmDescription": "Line one\nLine two {not a slot}",
+            "StateChangeTime": "2024-01-01T00:00:00+00:00",
+        }
+    )
+
+    card = json.loads(
+        main_module.create_adaptive_card(
+            alarm_data, main_module.get_state_style("ALARM")
+        )
+    )
+
+    content = card["attachments"][0]["content"]
+    assert content["body"][0]["text"] == '🚨 **Alarm Triggered: Disk "100%" full**'
+    assert content["body"][1]["color"] == "Attention"
+    assert content["body"][2]["text"] == (
+        "**Description:** Line one\nLine two {not a slot}"
+    )
+    assert content["body"][4]["facts"][3] == {"title": "Region", "value": "eu-west-1"}
+    assert content["actions"][0]["url"].endswith("Disk%20%22100%25%22%20full")
+
+
+def test_extract_alarm_data_uses_batch_default_time(main_module):
+    default_time = "2024-01-01T00:00:00+00:00"
+
+    missing = main_module.extract_alarm_data({"AlarmName": "A"}, default_time)
+    provided = main_module.extract_alarm_data(
+        {"AlarmName": "B", "StateChangeTime": "2024-02-02T00:00:00+00:00"},
+        default_time,
+    )
+
+    assert missing["alarm_time"] == default_time
+    assert provided["alarm_time"] == "2024-02-02T00:00:00+00:00"
+
+
+@pytest.mark.parametrize("strict", [False, True])
+@pytest.mark.parametrize(
+    ("candidate", "expected"),
+    [
+        ("https://example.com/webhook", True),
+        ("https://example.com", True),
+        ("HTTPS://example.com/webhook", True),
+        ("http://example.com/webhook", False),
+        ("https://", False),
+        ("https:///webhook", False),
+        ({"url": "https://example.com"}, False),
+    ],
+)
+def test_is_valid_webhook_url(main_module, monkeypatch, strict, candidate, expected):
+    monkeypatch.setattr(main_module, "STRICT_WEBHOOK_URL_VALIDATION", strict)
+
+    assert main_module._is_valid_webhook_url(candidate) is expected
+
+
 def test_process_sns_record_success(main_module, monkeypatch):
     event_payload = _build_sns_event_payload()
     sns_event = main_module.SNSEvent(event_payload)
     sns_record = list(sns_event.records)[0]
 
     secret_mock = MagicMock(return_value="https://example.com/webhook")
-    monkeypatch.setattr(main_module.secrets_provider, "get", secret_mock)
+    monkeypatch.setattr(main_module, "get_secret", secret_mock)
 
     send_mock = MagicMock(return_value=(True, "Success", 200))
     monkeypatch.setattr(main_module, "send_to_teams", send_mock)
@@ -97,10 +170,91 @@ def test_process_sns_record_success(main_module, monkeypatch):
     assert result["status_code"] == 200
     assert result["alarm_name"] == "HighCPU"
     send_mock.assert_called_once()
-    secret_mock.assert_called_once_with("secret-name")
+    secret_mock.assert_called_once_with("secret-name", force_fetch=True)
     assert main_module._webhook_url_cache == "https://example.com/webhook"
 
 
+def test_get_webhook_url_refetches_after_cache_expiry(main_module, monkeypatch):
+    secret_mock = MagicMock(
+        side_effect=[
+            "https://example.com/old",
+            "https://example.com/new",
+        ]
+    )
+    monkeypatch.setattr(main_module, "get_secret", secret_mock)
+
+    assert main_module.get_webhook_url() == "https://example.com/old"
+    assert main_module.get_webhook_url() == "https://example.com/old"
+
+    main_module._webhook_url_expires_at = 0.0
+
+    assert main_module.get_webhook_url() == "https://example.com/new"
+    assert secret_mock.call_count == 2
+
+
+def test_get_webhook_url_refreshes_once_for_concurrent_callers(
+    main_module, monkeypatch
+):
+    def slow_secret(*args, **kwargs):
+        time.sleep(0.05)
+        return "https://example.com/webhook"
+
+    secret_mock = MagicMock(side_effect=slow_secret)
+    monkeypatch.setattr(main_module, "get_secret", secret_mock)
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        urls = list(executor.map(lambda _: main_module.get_webhook_url(), range(5)))
+
+    assert urls == ["https://example.com/webhook"] * 5
+    assert secret_mock.call_count == 1
+
+
+def test_webhook_url_prefetched_during_init(monkeypatch):
+    monkeypatch.setenv("WEBHOOK_URL_SECRET_NAME", "secret-name")
+    monkeypatch.setenv("AWS_REGION", "eu-west-1")
+    monkeypatch.setenv("AWS_LAMBDA_FUNCTION_NAME", "phe-alarms")
+
+    secret_mock = MagicMock(return_value="https://example.com/webhook")
+    monkeypatch.setattr(
+        "aws_lambda_powertools.utilities.parameters.get_secret", secret_mock
+    )
+
+    module = importlib.reload(
+        importlib.import_module("cloudwatch_alerts_to_teams.app.main")
+    )
+
+    secret_mock.assert_called_once()
+    assert module._webhook_url_cache == "https://example.com/webhook"
+
+
+def test_process_sns_record_fails_fast_without_webhook(main_module, monkeypatch):
+    sns_record = list(main_module.SNSEvent(_build_sns_event_payload()).records)[0]
+
+    def missing_webhook():
+        raise main_module.ConfigurationError("no webhook")
+
+    monkeypatch.setattr(main_module, "get_webhook_url", missing_webhook)
+    extract_mock = MagicMock()
+    monkeypatch.setattr(main_module, "extract_alarm_data", extract_mock)
+
+    with pytest.raises(main_module.ConfigurationError):
+        main_module.process_sns_record(sns_record)
+
+    extract_mock.assert_not_called()
+
+
+def test_process_sns_record_rejects_invalid_json(main_module):
+    event_payload = _build_sns_event_payload()
+    event_payload["Records"][0]["Sns"]["Message"] = "{not json"
+    sns_record = list(main_module.SNSEvent(event_payload).records)[0]
+
+    with pytest.raises(main_module.InvalidAlarmPayloadError) as exc_info:
+        main_module.process_sns_record(sns_record)
+
+    assert exc_info.value.status_code == 400
+    assert str(exc_info.value).startswith("Invalid JSON in SNS message")
+
+
 def test_lambda_handler_partial_failure_returns_aggregate(main_module, monkeypatch):
     event_payload = _build_sns_event_payload(
         overrides_list=[
@@ -110,7 +264,7 @@ def test_lambda_handler_partial_failure_returns_aggregate(main_module, monkeypat
     )
 
     secret_mock = MagicMock(return_value="https://example.com/webhook")
-    monkeypatch.setattr(main_module.secrets_provider, "get", secret_mock)
+    monkeypatch.setattr(main_module, "get_secret", secret_mock)
 
     send_mock = MagicMock(side_effect=[(True, "Success", 200), (False, "boom", 500)])
     monkeypatch.setattr(main_module, "send_to_teams", send_mock)
@@ -128,12 +282,216 @@ def test_lambda_handler_partial_failure_returns_aggregate(main_module, monkeypat
     assert secret_mock.call_count == 1
 
 
+def test_requests_session_created_lazily_and_reused(main_module):
+    assert main_module.session is None
+
+    http_session = main_module._get_session()
+
+    assert main_module._get_session() is http_session
+    adapter = http_session.get_adapter("https://example.com/webhook")
+    assert adapter._pool_maxsize == main_module.HTTP_POOL_MAXSIZE
+    assert adapter.max_retries.total == 3
+
+
+def test_send_to_teams_posts_compact_json_bytes(main_module):
+    http_session = MagicMock()
+    http_session.post.return_value = SimpleNamespace(status_code=200)
+
+    success, message, status_code = main_module.send_to_teams(
+        {"type": "message", "text": "Résolu"},
+        "https://example.com/webhook",
+        http_session=http_session,
+    )
+
+    assert (success, message, status_code) == (True, "Success", 200)
+    _, kwargs = http_session.post.call_args
+    assert kwargs["data"] == '{"type":"message","text":"Résolu"}'.encode("utf-8")
+    assert kwargs["headers"] == {"Content-Type": "application/json"}
+    assert kwargs["timeout"] == 15
+
+
+def test_process_sns_record_async_publishes_card(main_module, monkeypatch):
+    sns_record = list(main_module.SNSEvent(_build_sns_event_payload()).records)[0]
+
+    events_client = MagicMock()
+    events_client.put_events.return_value = {"FailedEntryCount": 0, "Entries": [{}]}
+    monkeypatch.setattr(main_module, "DELIVERY_MODE", "async")
+    monkeypatch.setattr(main_module, "events_client", events_client)
+
+    send_mock = MagicMock()
+    monkeypatch.setattr(main_module, "send_to_teams", send_mock)
+
+    result = main_module.process_sns_record(sns_record)
+
+    assert result["status_code"] == 202
+    send_mock.assert_not_called()
+    (entry,) = events_client.put_events.call_args.kwargs["Entries"]
+    assert entry["Source"] == main_module.CARD_EVENT_SOURCE
+    assert entry["EventBusName"] == "default"
+    assert json.loads(entry["Detail"])["type"] == "message"
+
+
+def test_publish_card_raises_when_entry_rejected(main_module, monkeypatch):
+    events_client = MagicMock()
+    events_client.put_events.return_value = {
+        "FailedEntryCount": 1,
+        "Entries": [{"ErrorCode": "ThrottlingException", "ErrorMessage": "slow down"}],
+    }
+    monkeypatch.setattr(main_module, "events_client", events_client)
+
+    with pytest.raises(main_module.WebhookDeliveryError) as exc_info:
+        main_module.publish_card("{}")
+
+    assert str(exc_info.value) == (
+        "EventBridge rejected card: ThrottlingException: slow down"
+    )
+
+
+def test_publish_card_wraps_client_errors(main_module, monkeypatch):
+    events_client = MagicMock()
+    events_client.put_events.side_effect = ClientError(
+        {"Error": {"Code": "AccessDeniedException", "Message": "denied"}},
+        "PutEvents",
+    )
+    monkeypatch.setattr(main_module, "events_client", events_client)
+
+    with pytest.raises(main_module.WebhookDeliveryError) as exc_info:
+        main_module.publish_card("{}")
+
+    assert exc_info.value.status_code == 500
+    assert "AccessDeniedException" in str(exc_info.value)
+
+
+def test_async_mode_does_not_require_or_prefetch_webhook_secret(monkeypatch):
+    monkeypatch.delenv("WEBHOOK_URL_SECRET_NAME", raising=False)
+    monkeypatch.setenv("AWS_REGION", "eu-west-1")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "eu-west-1")
+    monkeypatch.setenv("AWS_LAMBDA_FUNCTION_NAME", "phe-alarms")
+    monkeypatch.setenv("DELIVERY_MODE", "async")
+
+    secret_mock = MagicMock()
+    monkeypatch.setattr(
+        "aws_lambda_powertools.utilities.parameters.get_secret", secret_mock
+    )
+
+    module = importlib.reload(
+        importlib.import_module("cloudwatch_alerts_to_teams.app.main")
+    )
+
+    assert module._CONFIG_ERROR == ""
+    secret_mock.assert_not_called()
+
+
+def test_delivery_handler_rejects_invalid_configuration(main_module, monkeypatch):
+    monkeypatch.setattr(main_module, "_CONFIG_ERROR", "AWS_REGION is required")
+    send_mock = MagicMock()
+    monkeypatch.setattr(main_module, "send_to_teams", send_mock)
+
+    with pytest.raises(main_module.ConfigurationError):
+        main_module.delivery_handler(
+            {"detail-type": "Teams Adaptive Card", "detail": {}}, SimpleNamespace()
+        )
+
+    send_mock.assert_not_called()
+
+
+def test_delivery_handler_sends_card_and_raises_on_failure(main_module, monkeypatch):
+    monkeypatch.setattr(
+        main_module, "get_webhook_url", lambda: "https://example.com/webhook"
+    )
+    send_mock = MagicMock(side_effect=[(True, "Success", 200), (False, "boom", 502)])
+    monkeypatch.setattr(main_module, "send_to_teams", send_mock)
+    event = {
+        "version": "0",
+        "id": "event-1",
+        "detail-type": "Teams Adaptive Card",
+        "source": "phe.alarms",
+        "detail": {"type": "message", "attachments": []},
+    }
+
+    response = main_module.delivery_handler(event, SimpleNamespace())
+
+    assert response["statusCode"] == 200
+    send_mock.assert_called_with(
+        {"type": "message", "attachments": []}, "https://example.com/webhook"
+    )
+
+    with pytest.raises(main_module.WebhookDeliveryError) as exc_info:
+        main_module.delivery_handler(event, SimpleNamespace())
+
+    assert exc_info.value.status_code == 502
+
+
+def test_lambda_handler_delivers_full_batch(main_module, monkeypatch):
+    batch_size = main_module.MAX_CONCURRENT_DELIVERIES
+    event_payload = _build_sns_event_payload(
+        overrides_list=[{"AlarmName": f"Alarm-{i}"} for i in range(batch_size)]
+    )
+
+    monkeypatch.setattr(
+        main_module, "get_webhook_url", lambda: "https://example.com/webhook"
+    )
+    send_mock = MagicMock(return_value=(True, "Success", 200))
+    monkeypatch.setattr(main_module, "send_to_teams", send_mock)
+
+    response = main_module.lambda_handler(event_payload, SimpleNamespace())
+
+    assert response["statusCode"] == 200
+    body = json.loads(response["body"])
+    assert send_mock.call_count == batch_size
+    assert [success["message_id"] for success in body["successes"]] == [
+        f"msg-{i}" for i in range(1, batch_size + 1)
+    ]
+
+
+def test_lambda_handler_processes_single_record_inline(main_module, monkeypatch):
+    executor_mock = MagicMock()
+    monkeypatch.setattr(main_module, "ThreadPoolExecutor", executor_mock)
+    monkeypatch.setattr(
+        main_module, "get_webhook_url", lambda: "https://example.com/webhook"
+    )
+    send_mock = MagicMock(return_value=(True, "Success", 200))
+    monkeypatch.setattr(main_module, "send_to_teams", send_mock)
+
+    response = main_module.lambda_handler(_build_sns_event_payload(), SimpleNamespace())
+
+    assert response["statusCode"] == 200
+    send_mock.assert_called_once()
+    executor_mock.assert_not_called()
+
+
+def test_send_to_teams_reports_truncated_error_body(main_module):
+    http_session = MagicMock()
+    http_session.post.return_value = SimpleNamespace(
+        status_code=400, content=("é" * 150).encode("utf-8")
+    )
+
+    success, message, status_code = main_module.send_to_teams(
+        "{}", "https://example.com/webhook", http_session=http_session
+    )
+
+    assert (success, status_code) == (False, 400)
+    assert message == f"Teams webhook returned 400: {'é' * 100}"
+
+
+def test_lambda_handler_rejects_invalid_configuration(main_module, monkeypatch):
+    monkeypatch.delenv("WEBHOOK_URL_SECRET_NAME")
+    module = importlib.reload(main_module)
+
+    response = module.lambda_handler(
+        _build_sns_event_payload(), SimpleNamespace(aws_request_id="req-1")
+    )
+
+    assert response["statusCode"] == 500
+    body = json.loads(response["body"])
+    assert body["error"] == "WEBHOOK_URL_SECRET_NAME variable is required"
+
+
 def test_lambda_handler_with_no_records_returns_400(main_module):
     response = main_module.lambda_handler({"Records": []}, SimpleNamespace())
 
     assert response["statusCode"] == 400
-    body = json.loads(response["body"])
-    assert body["error"] == "SNS event did not contain any records"
+    assert response["body"] == '{"error":"SNS event did not contain any records"}'
 
 
 def test_lambda_handler_handles_missing_sns_payload(main_module):